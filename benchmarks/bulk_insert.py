@@ -0,0 +1,120 @@
+"""
+Writing generated flashcards and stories with INSERT and with COPY.
+
+    python -m benchmarks.bulk_insert [--sizes 10 1000 100000]
+
+Runs FlashcardRepository.create_many and StoryRepository.save_many with the
+COPY threshold above and below the batch size. Runs against DATABASE_URL inside
+a transaction that is rolled back.
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy.exc import DBAPIError
+
+from benchmarks.support import create_user_with_deck, measure_async, report, rolled_back_session
+from config import settings
+from src.flashcard.domain.enum import FlashcardOwnerType
+from src.flashcard.domain.models.deck import Deck
+from src.flashcard.domain.models.flashcard import Flashcard
+from src.flashcard.domain.models.owner import Owner
+from src.flashcard.domain.models.story import Story
+from src.flashcard.domain.models.story_collection import StoryCollection
+from src.flashcard.domain.models.story_flashcard import StoryFlashcard
+from src.flashcard.domain.value_objects import FlashcardDeckId, FlashcardId, OwnerId
+from src.flashcard.infrastructure.repository.flashcard_repository import FlashcardRepository
+from src.flashcard.infrastructure.repository.story_repository import StoryRepository
+from src.shared.enum import LanguageLevel
+from src.shared.value_objects.language import Language
+from src.shared.value_objects.story_id import StoryId
+
+STORY_SIZE = 4
+
+
+def build_flashcards(deck: Deck, count: int) -> list[Flashcard]:
+    return [
+        Flashcard(
+            id=FlashcardId.no_id(),
+            front_word=f"Słowo {index}",
+            front_lang=Language.pl(),
+            back_word=f"Word {index}",
+            back_lang=Language.en(),
+            front_context=f"Zdanie ze słowem {index}",
+            back_context=f"Sentence with word {index}",
+            owner=deck.owner,
+            deck=deck,
+            level=LanguageLevel.B2,
+        )
+        for index in range(count)
+    ]
+
+
+def build_stories(deck: Deck, count: int) -> StoryCollection:
+    flashcards = build_flashcards(deck, count)
+    return StoryCollection(
+        stories=[
+            Story(
+                id=StoryId.no_id(),
+                flashcards=[
+                    StoryFlashcard(story_id=StoryId.no_id(), story_index=start, flashcard=f)
+                    for f in flashcards[start : start + STORY_SIZE]
+                ],
+            )
+            for start in range(0, count, STORY_SIZE)
+        ]
+    )
+
+
+async def timed(session, fn, repeat: int) -> float:
+    # A failed path must not abort the transaction holding the benchmark deck
+    connection = (await (await session.connection()).get_raw_connection()).driver_connection
+    await connection.execute("SAVEPOINT benchmark")
+    try:
+        return await measure_async(fn, repeat)
+    except DBAPIError as e:
+        await connection.execute("ROLLBACK TO SAVEPOINT benchmark")
+        print(f"  ! {e.orig.__class__.__name__}: {str(e.orig).splitlines()[0]}")
+        return float("nan")
+
+
+async def main(sizes: list[int]) -> None:
+    async with rolled_back_session() as session:
+        user_id, deck_id = await create_user_with_deck(session, 0)
+        owner = Owner(id=OwnerId(value=user_id), flashcard_owner_type=FlashcardOwnerType.USER)
+        deck = Deck(owner=owner, tag="b", name="b", default_language_level=LanguageLevel.B2)
+        deck.init(FlashcardDeckId(deck_id))
+        flashcards = FlashcardRepository(session)
+        stories = StoryRepository(flashcards, session)
+
+        for size in sizes:
+            repeat = 5 if size <= 1000 else 1
+            rows = []
+            for label, threshold in (("INSERT", size + 1), ("COPY", 0)):
+                settings.bulk_copy_threshold = threshold
+                rows.append(
+                    (
+                        f"create_many, {label}",
+                        await timed(
+                            session,
+                            lambda: flashcards.create_many(build_flashcards(deck, size)),
+                            repeat,
+                        ),
+                    )
+                )
+                rows.append(
+                    (
+                        f"stories save_many, {label}",
+                        await timed(
+                            session, lambda: stories.save_many(build_stories(deck, size)), repeat
+                        ),
+                    )
+                )
+            report(f"{size} flashcards (building domain objects included)", rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100_000])
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.sizes))
@@ -0,0 +1,116 @@
+"""
+Mapping database rows to domain objects, the CPU part of every repository read.
+
+    python -m benchmarks.domain_mapping [--rows 1000] [--decks 5]
+
+Maps in-memory column tuples shaped like the repositories' select(columns) results
+through their mappers and reports the median time and rows per second. The
+"mapper per row" cases disable interning to show what it saves. No database needed.
+"""
+
+import argparse
+import uuid
+from collections import namedtuple
+
+from benchmarks.support import measure
+from src.flashcard.domain.models.story_flashcard import StoryFlashcard
+from src.flashcard.domain.value_objects import FlashcardId
+from src.flashcard.infrastructure.repository.flashcard_mapper import FlashcardMapper
+from src.flashcard.infrastructure.repository.sm_two_flashcard_repository import (
+    SmTwoFlashcardRepository,
+)
+from src.shared.value_objects.story_id import StoryId
+from src.shared.value_objects.user_id import UserId
+
+FlashcardRow = namedtuple(
+    "FlashcardRow",
+    "id front_word front_lang back_word back_lang front_context back_context user_id admin_id "
+    "language_level emoji flashcard_deck_id",
+)
+NextFlashcardRow = namedtuple(
+    "NextFlashcardRow", FlashcardRow._fields + ("sm_last_rating", "sm_repetitions_in_session")
+)
+SmTwoRow = namedtuple(
+    "SmTwoRow",
+    "flashcard_id repetition_ratio repetition_interval repetition_count min_rating "
+    "repetitions_in_session last_rating",
+)
+
+
+def build_rows(count: int, decks: int) -> tuple[list, list, list]:
+    user_id = uuid.uuid4()
+    flashcard_rows = [
+        FlashcardRow(
+            index + 1,
+            f"Słowo {index}",
+            "pl",
+            f"Word {index}",
+            "en",
+            f"Zdanie ze słowem {index}",
+            f"Sentence with word {index}",
+            user_id,
+            None,
+            "B2",
+            "🐍" if index % 3 == 0 else None,
+            index % decks + 1,
+        )
+        for index in range(count)
+    ]
+    with_deck_rows = [row + (user_id, None, "t", "Deck", "B2") for row in flashcard_rows]
+    next_rows = [NextFlashcardRow(*row, 3, 0) for row in flashcard_rows]
+    sm_two_rows = [SmTwoRow(index + 1, 2.5, 6.0, 2, 1, 0, 3) for index in range(count)]
+    return with_deck_rows, next_rows, sm_two_rows
+
+
+def main(count: int, decks: int) -> None:
+    with_deck_rows, next_rows, sm_two_rows = build_rows(count, decks)
+    sm_two = SmTwoFlashcardRepository(criteria_factory=None, session=None, catalog=None)
+    user_id = UserId.new()
+    preloaded = FlashcardMapper()
+    deck_by_id = {row[11]: preloaded.deck(row[11], row[12:17]) for row in with_deck_rows}
+    mapped = [preloaded.flashcard_with_deck(row) for row in with_deck_rows]
+
+    def map_with_deck() -> list:
+        mapper = FlashcardMapper()
+        return [mapper.flashcard_with_deck(row) for row in with_deck_rows]
+
+    def map_next() -> list:
+        mapper = FlashcardMapper(dict(deck_by_id))
+        return [
+            mapper.flashcard(row, deck_by_id.get(row.flashcard_deck_id), row.sm_last_rating)
+            for row in next_rows
+        ]
+
+    cases = [
+        ("ids: FlashcardId + set membership", lambda: {FlashcardId(i) for i in range(count)}),
+        (
+            "SmTwoFlashcardRepository._map_sm_two",
+            lambda: [sm_two._map_sm_two(row, user_id) for row in sm_two_rows],
+        ),
+        (
+            "with deck, mapper per row",
+            lambda: [FlashcardMapper().flashcard_with_deck(row) for row in with_deck_rows],
+        ),
+        ("with deck, mapper per result set", map_with_deck),
+        ("next flashcards, mapper per result set", map_next),
+        (
+            "StoryFlashcard wrapping",
+            lambda: [
+                StoryFlashcard(story_id=StoryId(1), story_index=i, flashcard=f)
+                for i, f in enumerate(mapped)
+            ],
+        ),
+    ]
+
+    print(f"\n{count} rows over {decks} decks")
+    for label, fn in cases:
+        milliseconds = measure(fn, repeat=9)
+        print(f"  {label:<40} {milliseconds:9.2f} ms {count / milliseconds * 1000:12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--decks", type=int, default=5)
+    arguments = parser.parse_args()
+    main(arguments.rows, arguments.decks)
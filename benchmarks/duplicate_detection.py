@@ -0,0 +1,161 @@
+"""
+Duplicate detection for a 500-word generation against a 50k-flashcard deck.
+
+    python -m benchmarks.duplicate_detection [--words 500] [--deck-size 50000]
+
+Compares the previous quadratic, deep-copying dedup with the set-based one, and the
+LOWER(front_word) IN (...) lookup with = ANY(:array) served by the functional index.
+Runs against DATABASE_URL inside a transaction that is rolled back.
+"""
+
+import argparse
+import asyncio
+import uuid
+from copy import deepcopy
+
+from sqlalchemy import func, select, text
+
+from benchmarks.support import (
+    create_user_with_deck,
+    measure,
+    measure_async,
+    report,
+    rolled_back_session,
+)
+from core.models import Flashcards
+from src.flashcard.application.services.flashcard_duplicate_service import (
+    FlashcardDuplicateService,
+)
+from src.flashcard.domain.enum import FlashcardOwnerType
+from src.flashcard.domain.models.deck import Deck
+from src.flashcard.domain.models.flashcard import Flashcard
+from src.flashcard.domain.models.owner import Owner
+from src.flashcard.domain.models.story import Story
+from src.flashcard.domain.models.story_collection import StoryCollection
+from src.flashcard.domain.models.story_flashcard import StoryFlashcard
+from src.flashcard.domain.value_objects import FlashcardDeckId, FlashcardId, OwnerId
+from src.flashcard.infrastructure.repository.flashcard_duplicate_repository import (
+    FlashcardDuplicateRepository,
+)
+from src.shared.enum import LanguageLevel
+from src.shared.value_objects.language import Language
+from src.shared.value_objects.story_id import StoryId
+
+INDEX = "flashcards_flashcard_deck_id_lower_front_word_index"
+
+
+def build_stories(words: int, deck: Deck) -> StoryCollection:
+    # Every tenth word repeats an earlier one, every fifth one exists in the deck
+    stories = []
+    for start in range(0, words, 4):
+        flashcards = []
+        for index in range(start, min(start + 4, words)):
+            word = f"generated {index - 5}" if index % 10 == 9 else f"Generated {index}"
+            flashcards.append(
+                StoryFlashcard(
+                    story_id=StoryId.no_id(),
+                    story_index=start // 4,
+                    flashcard=Flashcard(
+                        id=FlashcardId.no_id(),
+                        front_word=word if index % 5 else f"Word {index + 1}",
+                        front_lang=Language.pl(),
+                        back_word="translation",
+                        back_lang=Language.en(),
+                        front_context="",
+                        back_context="",
+                        owner=deck.owner,
+                        deck=deck,
+                        level=LanguageLevel.B2,
+                    ),
+                )
+            )
+        stories.append(Story(id=StoryId.no_id(), flashcards=flashcards))
+    return StoryCollection(stories=stories)
+
+
+def legacy_unique(stories: StoryCollection) -> list[StoryFlashcard]:
+    """The previous in-memory part of FlashcardDuplicateService.remove_duplicates."""
+    front_words = [
+        sf.get_flashcard().front_word.lower() for sf in stories.get_all_story_flashcards()
+    ]
+    unique_words = list(dict.fromkeys(front_words))
+    unique_flashcards = []
+    for unique_word in unique_words:
+        for sf in stories.get_all_story_flashcards():
+            if sf.get_flashcard().front_word.lower() == unique_word:
+                unique_flashcards.append(deepcopy(sf))
+                break
+    return unique_flashcards
+
+
+class NoSavedWords:
+    async def get_already_saved_front_words(self, deck_id, front_words):
+        return []
+
+
+async def main(words: int, deck_size: int) -> None:
+    owner = Owner(id=OwnerId(value=uuid.uuid4()), flashcard_owner_type=FlashcardOwnerType.USER)
+    deck = Deck(owner=owner, tag="b", name="b", default_language_level=LanguageLevel.B2)
+    deck.init(FlashcardDeckId(1))
+    stories = build_stories(words, deck)
+    service = FlashcardDuplicateService(NoSavedWords())
+
+    report(
+        f"In-memory dedup of {words} generated words",
+        [
+            ("quadratic scan + deepcopy (previous)", measure(lambda: legacy_unique(stories))),
+            (
+                "single pass hash set (current)",
+                await measure_async(lambda: service.remove_duplicates(deck, stories)),
+            ),
+        ],
+    )
+
+    async with rolled_back_session() as session:
+        _, deck_id = await create_user_with_deck(session, deck_size)
+        front_words = [sf.flashcard.front_word for sf in stories.get_all_story_flashcards()]
+        lowered = list({word.lower() for word in front_words})
+
+        async def legacy_query():
+            query = (
+                select(Flashcards.front_word)
+                .where(Flashcards.flashcard_deck_id == deck_id)
+                .where(func.lower(Flashcards.front_word).in_(lowered))
+            )
+            return (await session.execute(query)).all()
+
+        repository = FlashcardDuplicateRepository(session)
+
+        async def current_query():
+            return await repository.get_already_saved_front_words(
+                FlashcardDeckId(deck_id), front_words
+            )
+
+        await session.execute(text(f"DROP INDEX IF EXISTS {INDEX}"))
+        without_index = [
+            ("LOWER() IN (...), no functional index", await measure_async(legacy_query)),
+            ("= ANY(:array), no functional index", await measure_async(current_query)),
+        ]
+
+        await session.execute(
+            text(f"CREATE INDEX {INDEX} ON flashcards (flashcard_deck_id, lower(front_word))")
+        )
+        await session.execute(text("ANALYZE flashcards"))
+        with_index = [
+            ("LOWER() IN (...), functional index", await measure_async(legacy_query)),
+            ("= ANY(:array), functional index (current)", await measure_async(current_query)),
+        ]
+
+        report(
+            f"Saved-word lookup of {len(lowered)} words in a {deck_size} flashcard deck "
+            f"({len(await current_query())} found)",
+            without_index + with_index,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--words", type=int, default=500)
+    parser.add_argument("--deck-size", type=int, default=50_000)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.words, arguments.deck_size))
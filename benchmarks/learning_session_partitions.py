@@ -0,0 +1,160 @@
+"""
+User-scoped rating queries and retention on partitioned learning sessions.
+
+    python -m benchmarks.learning_session_partitions [--rows 50000000] [--partitions 12]
+
+Fills the session id range partitions with --rows steps of many users, the measured
+user learning all along, and copies them to unpartitioned tables in a scratch
+schema. Rating stats of the user are timed on both layouts through the same
+repository query, then dropping the oldest partition is timed against deleting its
+sessions. Runs against DATABASE_URL inside a transaction that is rolled back.
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.support import create_user_with_deck, measure_async, report, rolled_back_session
+from core.database import SERVER_SETTINGS
+from src.flashcard.infrastructure.repository.flashcard_read_repository import (
+    FlashcardReadRepository,
+)
+from src.shared.enum import Language
+from src.shared.value_objects.user_id import UserId
+from src.study.infrastructure.repository.learning_session_partition_repository import (
+    LearningSessionPartitionRepository,
+)
+
+STEPS_PER_SESSION = 10
+OTHER_USERS = 100
+FLASHCARDS = 1000
+UNPARTITIONED_SCHEMA = "benchmark_unpartitioned"
+
+
+async def fill(session: AsyncSession, rows: int, partitions: int) -> tuple[UserId, int, int]:
+    """Returns the measured user, the first session id and the partition size."""
+    user_id, deck_id = await create_user_with_deck(session, FLASHCARDS)
+    await session.execute(
+        text(
+            "INSERT INTO users (id, name, email, password) "
+            "SELECT gen_random_uuid(), 'Other', 'other-' || n || '@benchmark.local', 'secret' "
+            "FROM generate_series(1, :count) AS n"
+        ),
+        {"count": OTHER_USERS},
+    )
+
+    sessions = rows // STEPS_PER_SESSION
+    repository = LearningSessionPartitionRepository(session)
+    repository.partition_size = size = -(-sessions // partitions)
+    first_index = await repository.current_partition() + 1
+    first_id = first_index * size
+    for index in range(first_index, first_index + partitions):
+        await repository.create(index)
+
+    # The measured user has every tenth session, in all of the partitions
+    await session.execute(
+        text(
+            "INSERT INTO learning_sessions (id, user_id, status, device, cards_per_session) "
+            "SELECT :first_id + n, CASE WHEN n % 10 = 0 "
+            "THEN CAST(:user_id AS uuid) "
+            "ELSE (SELECT id FROM users WHERE email = 'other-' || (n % :others + 1) "
+            "|| '@benchmark.local') END, 'finished', 'Benchmark', :steps "
+            "FROM generate_series(0, :sessions - 1) AS n"
+        ),
+        {
+            "first_id": first_id,
+            "sessions": sessions,
+            "user_id": user_id,
+            "others": OTHER_USERS,
+            "steps": STEPS_PER_SESSION,
+        },
+    )
+    await session.execute(
+        text(
+            "INSERT INTO learning_session_flashcards "
+            "(learning_session_id, flashcard_id, rating, is_additional) "
+            "SELECT :first_id + n / :steps, f.first_id + n % :flashcards, n % 4, false "
+            "FROM generate_series(0, :rows - 1) AS n, "
+            "(SELECT MIN(id) AS first_id FROM flashcards WHERE flashcard_deck_id = :deck_id) f"
+        ),
+        {
+            "first_id": first_id,
+            "steps": STEPS_PER_SESSION,
+            "flashcards": FLASHCARDS,
+            "rows": sessions * STEPS_PER_SESSION,
+            "deck_id": deck_id,
+        },
+    )
+
+    await session.execute(text(f"CREATE SCHEMA {UNPARTITIONED_SCHEMA}"))
+    for table in ("learning_sessions", "learning_session_flashcards"):
+        await session.execute(
+            text(
+                f"CREATE TABLE {UNPARTITIONED_SCHEMA}.{table} "
+                f"(LIKE {table} INCLUDING DEFAULTS INCLUDING INDEXES)"
+            )
+        )
+        await session.execute(
+            text(f"INSERT INTO {UNPARTITIONED_SCHEMA}.{table} SELECT * FROM {table}")
+        )
+    await session.execute(
+        text(
+            "ANALYZE learning_sessions, learning_session_flashcards, "
+            f"{UNPARTITIONED_SCHEMA}.learning_sessions, "
+            f"{UNPARTITIONED_SCHEMA}.learning_session_flashcards"
+        )
+    )
+    return UserId(value=user_id), first_index, size
+
+
+async def main(rows: int, partitions: int) -> None:
+    async with rolled_back_session() as session:
+        user_id, first_index, size = await fill(session, rows, partitions)
+        flashcards = FlashcardReadRepository(session)
+
+        async def rating_stats():
+            await flashcards.find_flashcard_stats(Language.PL, Language.EN, user_id=user_id)
+
+        timings = []
+        for layout, search_path in (
+            ("partitioned", "public"),
+            ("unpartitioned", f"{UNPARTITIONED_SCHEMA}, public"),
+        ):
+            await session.execute(text(f"SET LOCAL search_path = {search_path}"))
+            for name, value in SERVER_SETTINGS.items():
+                await session.execute(text(f"SET LOCAL {name} = {value}"))
+            timings.append((f"rating stats, {layout}", await measure_async(rating_stats)))
+        await session.execute(text("SET LOCAL search_path = public"))
+
+        async def drop_oldest_partition():
+            repository = LearningSessionPartitionRepository(session)
+            repository.partition_size = size
+            await repository.detach(first_index, None)
+
+        async def delete_oldest_sessions():
+            await session.execute(
+                text(
+                    f"DELETE FROM {UNPARTITIONED_SCHEMA}.learning_session_flashcards "
+                    "WHERE learning_session_id < :upper"
+                ),
+                {"upper": (first_index + 1) * size},
+            )
+            await session.execute(
+                text(f"DELETE FROM {UNPARTITIONED_SCHEMA}.learning_sessions WHERE id < :upper"),
+                {"upper": (first_index + 1) * size},
+            )
+
+        timings.append(("drop oldest partition", await measure_async(drop_oldest_partition, 1)))
+        timings.append(("delete oldest sessions", await measure_async(delete_oldest_sessions, 1)))
+
+        report(f"{rows} session steps in {partitions} partitions", timings)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--partitions", type=int, default=12)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.rows, arguments.partitions))
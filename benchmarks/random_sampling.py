@@ -0,0 +1,90 @@
+"""
+Random flashcard sampling latency as a deck grows.
+
+    python -m benchmarks.random_sampling [--sizes 1000 10000 100000] [--limit 10]
+
+Compares ORDER BY random() LIMIT n with the hashed-key index sampling and the
+cached initial letter histogram. Runs against DATABASE_URL inside a transaction
+that is rolled back.
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import func, select
+
+from benchmarks.support import create_user_with_deck, measure_async, report, rolled_back_session
+from core.models import FlashcardDecks, Flashcards
+from src.flashcard.domain.value_objects import FlashcardDeckId
+from src.flashcard.infrastructure.repository.flashcard_duplicate_repository import (
+    FlashcardDuplicateRepository,
+)
+from src.flashcard.infrastructure.repository.flashcard_repository import FlashcardRepository
+from src.shared.util.cache import LocalCache
+
+
+async def main(sizes: list[int], limit: int) -> None:
+    async with rolled_back_session() as session:
+        flashcards = FlashcardRepository(session)
+        duplicates = FlashcardDuplicateRepository(session, LocalCache())
+
+        for size in sizes:
+            _, deck_id = await create_user_with_deck(session, size)
+            deck = FlashcardDeckId(deck_id)
+
+            async def legacy_flashcards():
+                query = (
+                    select(Flashcards, FlashcardDecks)
+                    .join(FlashcardDecks, Flashcards.flashcard_deck_id == FlashcardDecks.id)
+                    .where(Flashcards.flashcard_deck_id == deck_id)
+                    .order_by(func.random())
+                    .limit(limit)
+                )
+                return (await session.execute(query)).all()
+
+            async def legacy_letters():
+                query = (
+                    select(Flashcards.front_word)
+                    .where(Flashcards.flashcard_deck_id == deck_id)
+                    .order_by(func.random())
+                    .limit(5)
+                )
+                return (await session.execute(query)).all()
+
+            report(
+                f"Deck of {size} flashcards",
+                [
+                    (
+                        f"{limit} flashcards, ORDER BY random()",
+                        await measure_async(legacy_flashcards),
+                    ),
+                    (
+                        f"{limit} flashcards, hashed key sampling",
+                        await measure_async(
+                            lambda: flashcards.get_random_flashcards_by_category(deck, limit, [])
+                        ),
+                    ),
+                    ("initial letters, ORDER BY random()", await measure_async(legacy_letters)),
+                    (
+                        "initial letters, histogram (first call builds it)",
+                        await measure_async(
+                            lambda: duplicates.get_random_front_word_initial_letters(deck, 5),
+                            repeat=1,
+                        ),
+                    ),
+                    (
+                        "initial letters, cached histogram",
+                        await measure_async(
+                            lambda: duplicates.get_random_front_word_initial_letters(deck, 5)
+                        ),
+                    ),
+                ],
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000, 100_000])
+    parser.add_argument("--limit", type=int, default=10)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.sizes, arguments.limit))
@@ -0,0 +1,96 @@
+"""
+Serializing a deck details page of 100 flashcards.
+
+    python -m benchmarks.response_serialization [--flashcards 100]
+
+Compares FastAPI's default response path (validate against response_model, serialize,
+json.dumps in JSONResponse) with ModelResponse, which serializes the mapped model once
+with its pydantic-core serializer. Mapping the DTO to the response model is measured
+separately since both paths pay for it. No database needed.
+"""
+
+import argparse
+import json
+from datetime import datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.utils import create_model_field
+
+from benchmarks.support import measure
+from core.generics import ResponseWrapper
+from core.responses import ModelResponse
+from src.flashcard.application.dto.deck_details_read import DeckDetailsRead
+from src.flashcard.application.dto.flashcard_read import FlashcardRead
+from src.flashcard.application.dto.general_rating import GeneralRating
+from src.flashcard.domain.enum import FlashcardOwnerType, GeneralRatingType
+from src.flashcard.domain.value_objects import FlashcardDeckId, FlashcardId
+from src.flashcard.infrastructure.http.mappers import (
+    generate_flashcards_result_resource_mapper as mapper,
+)
+from src.flashcard.infrastructure.http.response import DeckDetailsResponse
+from src.shared.enum import LanguageLevel
+from src.shared.models import Emoji
+from src.shared.value_objects.language import Language
+
+
+def build_deck(count: int) -> DeckDetailsRead:
+    return DeckDetailsRead(
+        id=FlashcardDeckId(1),
+        name="Podróże",
+        flashcards=[
+            FlashcardRead(
+                id=FlashcardId(index + 1),
+                front_word=f"lotnisko {index}",
+                front_lang=Language.pl(),
+                back_word=f"airport {index}",
+                back_lang=Language.en(),
+                front_context=f"Samolot wylądował na lotnisku {index}.",
+                back_context=f"The plane landed at the airport {index}.",
+                general_rating=GeneralRating(value=GeneralRatingType.GOOD),
+                language_level=LanguageLevel.B1,
+                rating_percentage=75.0,
+                emoji=Emoji.from_unicode("✈️"),
+                owner_type=FlashcardOwnerType.USER,
+            )
+            for index in range(count)
+        ],
+        page=1,
+        per_page=count,
+        count=count,
+        owner_type=FlashcardOwnerType.USER,
+        language_level=LanguageLevel.B1,
+        last_learnt_at=datetime(2025, 1, 1, 12, 30),
+        rating_percentage=75.0,
+    )
+
+
+def main(count: int) -> None:
+    deck = build_deck(count)
+    response = mapper(deck)
+    field = create_model_field(
+        name="Response_benchmark", type_=ResponseWrapper[DeckDetailsResponse], mode="serialization"
+    )
+
+    def fastapi_default() -> bytes:
+        # What fastapi.routing.serialize_response does for a pydantic v2 response_model
+        value, errors = field.validate(response, {}, loc=("response",))
+        assert not errors
+        return JSONResponse(field.serialize(value, by_alias=True)).body
+
+    assert json.loads(ModelResponse(response).body) == json.loads(fastapi_default())
+    rows = [
+        ("mapper: DeckDetailsRead -> response", lambda: mapper(deck)),
+        ("FastAPI default: validate + serialize + dumps", fastapi_default),
+        ("ModelResponse", lambda: ModelResponse(response).body),
+    ]
+
+    print(f"\nDeck details page, {count} flashcards, {len(ModelResponse(response).body)} bytes")
+    for label, fn in rows:
+        print(f"  {label:<48} {measure(fn, repeat=201):8.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--flashcards", type=int, default=100)
+    arguments = parser.parse_args()
+    main(arguments.flashcards)
@@ -0,0 +1,67 @@
+"""
+Rebuilding SM-2 state from the rating log, vectorized and row by row.
+
+    python -m benchmarks.sm_two_replay [--events 100000 1000000] [--users 1000]
+
+Replays a synthetic log with replay_sm_two and with SmTwoFlashcard.update_by_rating
+per event, the way the rating path applies them. No database needed.
+"""
+
+import argparse
+import random
+import uuid
+
+from benchmarks.support import measure
+from src.flashcard.application.dto.sm_two_replay import RatingEventLog
+from src.flashcard.application.services.sm_two.sm_two_replay import replay_sm_two
+from src.flashcard.domain.enum import Rating
+from src.flashcard.domain.models.sm_two_flashcard import SmTwoFlashcard
+from src.flashcard.domain.value_objects import FlashcardId
+from src.shared.value_objects.user_id import UserId
+
+FLASHCARDS_PER_USER = 200
+
+
+def build_log(events: int, users: int) -> RatingEventLog:
+    generator = random.Random(events)
+    user_ids = [uuid.UUID(int=generator.getrandbits(128)) for _ in range(users)]
+    ratings = list(Rating)
+    log = RatingEventLog(users=user_ids)
+    for _ in range(events):
+        log.user_codes.append(generator.randrange(users))
+        log.flashcard_ids.append(generator.randint(1, FLASHCARDS_PER_USER))
+        log.ratings.append(generator.choice(ratings).value)
+    return log
+
+
+def replay_row_by_row(log: RatingEventLog) -> dict:
+    states: dict[tuple[uuid.UUID, int], SmTwoFlashcard] = {}
+    for user_code, flashcard_id, rating in zip(log.user_codes, log.flashcard_ids, log.ratings):
+        user_id = log.users[user_code]
+        state = states.get((user_id, flashcard_id))
+        if state is None:
+            state = states[(user_id, flashcard_id)] = SmTwoFlashcard(
+                UserId(value=user_id), FlashcardId(flashcard_id)
+            )
+        state.update_by_rating(Rating(rating))
+    return states
+
+
+def main(sizes: list[int], users: int) -> None:
+    for events in sizes:
+        log = build_log(events, users)
+        vectorized = measure(lambda: replay_sm_two(log), repeat=3)
+        row_by_row = measure(lambda: replay_row_by_row(log), repeat=3)
+
+        print(f"\n{events} events of {users} users")
+        for label, milliseconds in [("replay_sm_two", vectorized), ("row by row", row_by_row)]:
+            rate = events / milliseconds * 1000
+            print(f"  {label:<20} {milliseconds:10.2f} ms {rate:14,.0f} events/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--users", type=int, default=1000)
+    arguments = parser.parse_args()
+    main(arguments.events, arguments.users)
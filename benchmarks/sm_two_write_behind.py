@@ -0,0 +1,184 @@
+"""
+Rating requests with SM-2 and Leitner state saved in them and written behind.
+
+    python -m benchmarks.sm_two_write_behind [--sessions 20] [--ratings 20] [--flashcards 5]
+
+Runs --sessions learning sessions of --ratings ratings, each session repeating
+--flashcards flashcards, once saving the state in every rating request and once
+only appending the ratings to the log and applying them in one flush per session,
+the way SmTwoWriteBuffer does. Reports the median request time, the time of the
+flushes, the rows written and the WAL generated per session. Runs against
+DATABASE_URL inside a transaction that is rolled back.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.support import create_user_with_deck, report, rolled_back_session
+from config import settings
+from src.flashcard.application.services.flashcard_poll_updater import FlashcardPollUpdater
+from src.flashcard.application.services.sm_two.sm_two_repetition_algorithm import (
+    SmTwoRepetitionAlgorithm,
+)
+from src.flashcard.application.services.sm_two.sm_two_write_behind import SmTwoWriteBehind
+from src.flashcard.domain.enum import Rating
+from src.flashcard.domain.value_objects import FlashcardId
+from src.flashcard.infrastructure.repository.admin_deck_catalog import AdminDeckCatalog
+from src.flashcard.infrastructure.repository.flashcard_poll_repository import (
+    FlashcardPollRepository,
+)
+from src.flashcard.infrastructure.repository.rating_event_repository import (
+    RatingEventRepository,
+)
+from src.flashcard.infrastructure.repository.sm_two.criteria_factory import (
+    FlashcardSortCriteriaFactory,
+)
+from src.flashcard.infrastructure.repository.sm_two_flashcard_repository import (
+    SmTwoFlashcardRepository,
+)
+from src.flashcard.infrastructure.worker.sm_two_write_buffer import SmTwoWriteBuffer
+from src.shared.util.unit_of_work import UnitOfWork
+from src.shared.value_objects.user_id import UserId
+
+
+class Usage:
+    """Rows written and WAL generated by the transaction since the last call."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.rows = 0
+        self.lsn = ""
+
+    async def take(self) -> tuple[int, int]:
+        rows, lsn = (
+            await self.session.execute(
+                text(
+                    "SELECT (SELECT coalesce(sum(n_tup_ins + n_tup_upd + n_tup_del), 0) "
+                    "FROM pg_stat_xact_user_tables), pg_current_wal_insert_lsn()"
+                )
+            )
+        ).one()
+        wal = (
+            await self.session.scalar(
+                text("SELECT pg_wal_lsn_diff(:lsn, :previous)"),
+                {"lsn": lsn, "previous": self.lsn},
+            )
+            if self.lsn
+            else 0
+        )
+        rows, self.rows, self.lsn = rows - self.rows, rows, lsn
+        return rows, int(wal)
+
+
+async def create_user(session: AsyncSession, flashcards: int) -> tuple[UserId, list[FlashcardId]]:
+    user_id, deck_id = await create_user_with_deck(session, flashcards)
+    await session.execute(
+        text(
+            "INSERT INTO flashcard_poll_items (user_id, flashcard_id, leitner_level) "
+            "SELECT user_id, id, 0 FROM flashcards WHERE flashcard_deck_id = :deck_id"
+        ),
+        {"deck_id": deck_id},
+    )
+    flashcard_ids = await session.scalars(
+        text("SELECT id FROM flashcards WHERE flashcard_deck_id = :deck_id ORDER BY id"),
+        {"deck_id": deck_id},
+    )
+    return UserId(value=user_id), [FlashcardId(flashcard_id) for flashcard_id in flashcard_ids]
+
+
+def build(session: AsyncSession) -> tuple[RatingEventRepository, SmTwoRepetitionAlgorithm]:
+    algorithm = SmTwoRepetitionAlgorithm(
+        SmTwoFlashcardRepository(FlashcardSortCriteriaFactory(), session, AdminDeckCatalog()),
+        FlashcardPollUpdater(FlashcardPollRepository(session)),
+    )
+    return RatingEventRepository(session), algorithm
+
+
+def session_ratings(ratings: int) -> list[Rating]:
+    choices = list(Rating)
+    return [choices[index % len(choices)] for index in range(ratings)]
+
+
+async def run_sync(
+    session: AsyncSession, sessions: int, ratings: int, flashcards: int
+) -> tuple[list[float], int, int]:
+    rating_events, algorithm = build(session)
+    user_id, flashcard_ids = await create_user(session, flashcards)
+    usage = Usage(session)
+    await usage.take()
+
+    requests = []
+    for _ in range(sessions):
+        for index, rating in enumerate(session_ratings(ratings)):
+            rated = [(flashcard_ids[index % flashcards], rating)]
+            started = time.perf_counter()
+            await rating_events.add_many(user_id, rated)
+            await algorithm.handle_many(user_id, rated)
+            requests.append((time.perf_counter() - started) * 1000)
+    rows, wal = await usage.take()
+    return requests, rows, wal
+
+
+async def run_write_behind(
+    session: AsyncSession, sessions: int, ratings: int, flashcards: int
+) -> tuple[list[float], list[float], int, int]:
+    rating_events, algorithm = build(session)
+    write_behind = SmTwoWriteBehind(
+        UnitOfWork(session), rating_events, algorithm, SmTwoWriteBuffer()
+    )
+    user_id, flashcard_ids = await create_user(session, flashcards)
+    usage = Usage(session)
+    await usage.take()
+
+    requests, flushes = [], []
+    for _ in range(sessions):
+        for index, rating in enumerate(session_ratings(ratings)):
+            rated = [(flashcard_ids[index % flashcards], rating)]
+            started = time.perf_counter()
+            await write_behind.record(user_id, rated)
+            requests.append((time.perf_counter() - started) * 1000)
+        started = time.perf_counter()
+        await write_behind.apply_pending(user_id)
+        flushes.append((time.perf_counter() - started) * 1000)
+    rows, wal = await usage.take()
+    return requests, flushes, rows, wal
+
+
+async def main(sessions: int, ratings: int, flashcards: int) -> None:
+    settings.repetition_write_behind = True
+    async with rolled_back_session() as session:
+        sync_requests, sync_rows, sync_wal = await run_sync(session, sessions, ratings, flashcards)
+        behind_requests, flushes, behind_rows, behind_wal = await run_write_behind(
+            session, sessions, ratings, flashcards
+        )
+
+    report(
+        f"{sessions} sessions of {ratings} ratings over {flashcards} flashcards",
+        [
+            ("saved in the request, median request", statistics.median(sync_requests)),
+            ("written behind, median request", statistics.median(behind_requests)),
+            ("written behind, median flush", statistics.median(flushes)),
+            ("saved in the requests, total", sum(sync_requests)),
+            ("written behind, requests and flushes total", sum(behind_requests) + sum(flushes)),
+        ],
+    )
+    print("\nPer session")
+    for label, rows, wal in [
+        ("saved in the requests", sync_rows, sync_wal),
+        ("written behind", behind_rows, behind_wal),
+    ]:
+        print(f"  {label:<32} {rows / sessions:8.1f} rows {wal / sessions / 1024:10.1f} KiB WAL")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--ratings", type=int, default=20)
+    parser.add_argument("--flashcards", type=int, default=5)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.sessions, arguments.ratings, arguments.flashcards))
@@ -0,0 +1,84 @@
+import statistics
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from config import settings
+
+
+@asynccontextmanager
+async def rolled_back_session() -> AsyncIterator[AsyncSession]:
+    """Session inside a transaction that is always rolled back, so benchmarks leave no data."""
+    engine = create_async_engine(settings.database_url)
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = async_sessionmaker(bind=connection, expire_on_commit=False)()
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+    await engine.dispose()
+
+
+async def create_user_with_deck(session: AsyncSession, flashcards: int) -> tuple[uuid.UUID, int]:
+    """Insert a user and a deck with the given number of flashcards, set-based."""
+    user_id = uuid.uuid4()
+    await session.execute(
+        text(
+            "INSERT INTO users (id, name, email, password) "
+            "VALUES (:id, 'Benchmark', :email, 'secret')"
+        ),
+        {"id": user_id, "email": f"{user_id}@benchmark.local"},
+    )
+    deck_id = (
+        await session.execute(
+            text(
+                "INSERT INTO flashcard_decks (id, tag, name, default_language_level, user_id) "
+                "VALUES (nextval('flashcard_categories_id_seq'), 'benchmark', 'Benchmark', "
+                "'B2', :user_id) RETURNING id"
+            ),
+            {"user_id": user_id},
+        )
+    ).scalar_one()
+    await session.execute(
+        text(
+            "INSERT INTO flashcards (front_word, front_lang, back_word, back_lang, "
+            "front_context, back_context, language_level, user_id, flashcard_deck_id) "
+            "SELECT 'Word ' || n, 'pl', 'word ' || n, 'en', '', '', 'B2', :user_id, :deck_id "
+            "FROM generate_series(1, :count) AS n"
+        ),
+        {"user_id": user_id, "deck_id": deck_id, "count": flashcards},
+    )
+    await session.execute(text("ANALYZE flashcards"))
+    return user_id, deck_id
+
+
+def measure(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Median wall time of a synchronous callable, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def measure_async(fn: Callable[[], Awaitable[object]], repeat: int = 5) -> float:
+    """Median wall time of a coroutine function, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def report(title: str, rows: list[tuple[str, float]]) -> None:
+    print(f"\n{title}")
+    for label, milliseconds in rows:
+        print(f"  {label:<48} {milliseconds:10.2f} ms")
@@ -0,0 +1,110 @@
+import asyncio
+import core.database as database
+from core.container import create_container
+from core.database import Database
+import typer
+from pathlib import Path
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from src.flashcard.application.command.import_deck import ImportDeck, ImportDeckHandler
+from src.flashcard.application.query.export_deck import ExportDeck
+from src.flashcard.domain.enum import FlashcardOwnerType
+from src.flashcard.domain.models.owner import Owner
+from src.flashcard.domain.value_objects import FlashcardDeckId, OwnerId
+from src.flashcard.infrastructure.archive.deck_archive_codec import (
+    decode_deck_archive,
+    encode_deck_archive,
+)
+from src.shared.util.msgpack_stream import DEFAULT_CHUNK_SIZE
+from src.shared.value_objects.user_id import UserId
+from config import settings
+
+app = typer.Typer(help="Deck import/export CLI")
+
+database.db = Database(settings.database_url)
+
+
+async def read_chunks(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := file.read(DEFAULT_CHUNK_SIZE):
+            yield chunk
+
+
+@app.command("export")
+def export(
+    deck_id: int = typer.Argument(..., help="Deck to export"),
+    output: Path = typer.Argument(..., help="Archive file to write"),
+    user_id: Optional[UUID] = typer.Option(
+        None, help="Export as this user, defaults to the deck owner"
+    ),
+    with_progress: bool = typer.Option(False, help="Include the user's SM-2 progress"),
+):
+    """Write a deck, its stories and optionally SM-2 progress to a msgpack archive"""
+
+    async def run() -> int:
+        async with database.db.session_factory() as session:
+            export_deck: ExportDeck = create_container(session).resolve(ExportDeck)
+            archive = await export_deck.export(
+                FlashcardDeckId(value=deck_id),
+                Owner.from_user(UserId(value=user_id)) if user_id else None,
+                with_progress,
+            )
+
+            size = 0
+            with output.open("wb") as file:
+                async for chunk in encode_deck_archive(archive):
+                    file.write(chunk)
+                    size += len(chunk)
+            return size
+
+    size = asyncio.run(run())
+
+    typer.echo(f"✅ Exported deck {deck_id} to {output} ({size} bytes)")
+
+
+@app.command("import")
+def import_(
+    archive_file: Path = typer.Argument(..., exists=True, help="Archive file to read"),
+    user_id: Optional[UUID] = typer.Option(None, help="User owning the imported flashcards"),
+    admin_id: Optional[UUID] = typer.Option(None, help="Admin owning the imported flashcards"),
+    deck_id: Optional[int] = typer.Option(
+        None, help="Deck to import to, a new deck is created when omitted"
+    ),
+    name: Optional[str] = typer.Option(None, help="Name of the new deck"),
+    with_progress: bool = typer.Option(False, help="Import SM-2 progress of a user deck"),
+):
+    """Import a deck archive through the bulk insert path, skipping near-duplicates"""
+
+    if (user_id is None) == (admin_id is None):
+        raise typer.BadParameter("Pass exactly one of --user-id and --admin-id")
+
+    owner = Owner(
+        id=OwnerId(value=user_id or admin_id),
+        flashcard_owner_type=FlashcardOwnerType.USER if user_id else FlashcardOwnerType.ADMIN,
+    )
+    command = ImportDeck(
+        owner=owner,
+        deck_id=FlashcardDeckId(value=deck_id) if deck_id else None,
+        name=name,
+        with_progress=with_progress,
+    )
+
+    async def run():
+        async with database.db.session_factory() as session:
+            handler: ImportDeckHandler = create_container(session).resolve(ImportDeckHandler)
+            # Committed by the handler batch by batch
+            return await handler.handle(
+                command, await decode_deck_archive(read_chunks(archive_file))
+            )
+
+    result = asyncio.run(run())
+
+    typer.echo(
+        f"✅ Imported {result.imported_count} flashcards into deck {result.deck_id.value}, "
+        f"skipped {result.skipped_count} duplicates"
+    )
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,48 @@
+import asyncio
+import core.database as database
+from core.container import create_container
+from core.database import Database
+from core.events import get_outbox_relay
+import typer
+from typing import Optional
+
+from config import settings
+
+app = typer.Typer(help="Event outbox maintenance CLI")
+
+database.db = Database(settings.database_url)
+
+
+@app.command("failed")
+def failed(
+    limit: int = typer.Option(100, help="Events to list, oldest first"),
+):
+    """List deferred events that failed too often and hold back their streams"""
+
+    events = asyncio.run(
+        get_outbox_relay().failed(database.db.session_factory, create_container, limit)
+    )
+    for event in events:
+        typer.echo(
+            f"{event.id}\t{event.event_type}\t{event.stream or '-'}\t"
+            f"{event.attempts}\t{event.failed_at:%Y-%m-%d %H:%M:%S}\t{event.error}"
+        )
+
+    typer.echo(f"Found {len(events)} failed events", err=True)
+
+
+@app.command("retry")
+def retry(
+    ids: Optional[list[int]] = typer.Argument(None, help="Events to retry, defaults to all"),
+):
+    """Give failed deferred events fresh attempts once their cause is fixed"""
+
+    retried = asyncio.run(
+        get_outbox_relay().retry_failed(database.db.session_factory, create_container, ids or None)
+    )
+
+    typer.echo(f"✅ Retried {retried} failed events, relays pick them up on their next poll")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,53 @@
+import asyncio
+import sys
+import core.database as database
+from core.database import Database
+import typer
+from pathlib import Path
+from typing import Optional
+
+from src.flashcard.infrastructure.worker.near_duplicate_reporter import NearDuplicateReporter
+from config import settings
+
+app = typer.Typer(help="Flashcard near-duplicate maintenance CLI")
+
+database.db = Database(settings.database_url)
+
+
+@app.command("backfill")
+def backfill(
+    batch_size: int = typer.Option(1000, help="Flashcards normalized per transaction"),
+):
+    """Fill normalized front words of flashcards saved before the column existed"""
+
+    reporter = NearDuplicateReporter(database.db.session_factory, batch_size=batch_size)
+    count = asyncio.run(reporter.backfill())
+
+    typer.echo(f"✅ Normalized {count} front words")
+
+
+@app.command("report")
+def report(
+    output: Optional[Path] = typer.Option(None, help="JSON lines file, defaults to stdout"),
+    batch_size: int = typer.Option(1000, help="Rows or groups processed per transaction"),
+    skip_backfill: bool = typer.Option(False, help="Report without normalizing new rows first"),
+):
+    """Report flashcards of the same owner sharing a normalized front word"""
+
+    reporter = NearDuplicateReporter(database.db.session_factory, batch_size=batch_size)
+
+    async def run() -> int:
+        if not skip_backfill:
+            await reporter.backfill()
+        if output is None:
+            return await reporter.report(sys.stdout)
+        with output.open("w", encoding="utf-8") as file:
+            return await reporter.report(file)
+
+    count = asyncio.run(run())
+
+    typer.echo(f"✅ Found {count} near-duplicate groups", err=True)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,38 @@
+import asyncio
+import core.database as database
+from core.database import Database
+import typer
+from typing import Optional
+
+from core.gemini import generation_job_timeout
+from src.flashcard.domain.prompt_templates import prompt_templates
+from src.flashcard.infrastructure.worker.generation_worker import GenerationWorker
+from config import settings
+
+app = typer.Typer(help="Flashcard generation worker CLI")
+
+database.db = Database(settings.database_url)
+
+
+@app.command("run")
+def run(
+    concurrency: Optional[int] = typer.Option(None, help="Number of jobs processed at once"),
+    timeout: Optional[int] = typer.Option(None, help="Seconds a single job may take"),
+):
+    """Process queued flashcard generation jobs until stopped"""
+
+    if settings.flashcard_prompt_dir:
+        prompt_templates.load_directory(settings.flashcard_prompt_dir)
+
+    worker = GenerationWorker(
+        database.db.session_factory,
+        concurrency=concurrency or max(settings.generation_workers, 1),
+        timeout=timeout or generation_job_timeout(),
+    )
+
+    typer.echo(f"🚀 Processing generation jobs with {worker.concurrency} slots")
+    asyncio.run(worker.run())
+
+
+if __name__ == "__main__":
+    app()
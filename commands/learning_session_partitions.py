@@ -0,0 +1,52 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import core.database as database
+from core.database import Database
+import typer
+
+from src.study.infrastructure.worker.learning_session_partitioner import (
+    LearningSessionPartitioner,
+)
+from config import settings
+
+app = typer.Typer(help="Learning session partition maintenance CLI")
+
+database.db = Database(settings.database_url)
+
+
+@app.command("create-ahead")
+def create_ahead(
+    ahead: int = typer.Option(2, help="Partitions to create past the one of the newest session"),
+):
+    """Create the session id range partitions new sessions will need"""
+
+    partitioner = LearningSessionPartitioner(database.db.session_factory)
+    created = asyncio.run(partitioner.create_ahead(ahead))
+
+    typer.echo(f"✅ Created {len(created)} partitions {created}")
+
+
+@app.command("detach")
+def detach(
+    inactive_days: int = typer.Option(365, help="Detach partitions without activity this long"),
+    archive_schema: Optional[str] = typer.Option(
+        "archive", help="Schema receiving detached partitions"
+    ),
+    drop: bool = typer.Option(False, help="Drop detached partitions instead of archiving"),
+):
+    """Detach the oldest partitions of sessions nobody touched since the cutoff"""
+
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=inactive_days)
+    partitioner = LearningSessionPartitioner(database.db.session_factory)
+    detached = asyncio.run(
+        partitioner.detach_inactive_since(cutoff, None if drop else archive_schema)
+    )
+
+    action = "Dropped" if drop else f"Moved to schema {archive_schema}"
+    typer.echo(f"✅ {action}: {len(detached)} partitions {detached}")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,61 @@
+import asyncio
+import json
+import core.database as database
+from core.database import Database
+import typer
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+from src.flashcard.application.dto.admin_deck_manifest import AdminDeckManifest
+from src.flashcard.domain.prompt_templates import prompt_templates
+from src.flashcard.infrastructure.worker.admin_deck_seeder import AdminDeckSeeder, SeedCheckpoint
+from config import settings
+
+app = typer.Typer(help="Admin deck seeding CLI")
+
+database.db = Database(settings.database_url)
+
+
+@app.command("run")
+def run(
+    manifest: Path = typer.Argument(
+        ..., exists=True, help="JSON manifest with topics, levels and language pairs"
+    ),
+    checkpoint: Optional[Path] = typer.Option(
+        None, help="Progress file, defaults to <manifest>.checkpoint.jsonl"
+    ),
+    admin_id: Optional[UUID] = typer.Option(
+        None, help="Admin owning the decks, overrides the manifest"
+    ),
+    concurrency: int = typer.Option(4, help="Number of decks generated at once"),
+    timeout: int = typer.Option(300, help="Seconds a single item may take"),
+):
+    """Generate admin decks from a manifest, resuming from the checkpoint file"""
+
+    if settings.flashcard_prompt_dir:
+        prompt_templates.load_directory(settings.flashcard_prompt_dir)
+
+    seed_manifest = AdminDeckManifest.model_validate(
+        json.loads(manifest.read_text(encoding="utf-8"))
+    )
+    progress = SeedCheckpoint(str(checkpoint or manifest.with_suffix(".checkpoint.jsonl")))
+    seeder = AdminDeckSeeder(
+        database.db.session_factory, progress, concurrency=concurrency, timeout=timeout
+    )
+
+    total = len(seed_manifest.items())
+    typer.echo(f"🚀 Seeding {total} items ({len(progress.done)} already done)")
+
+    report = asyncio.run(seeder.run(seed_manifest, admin_id))
+
+    typer.echo(
+        f"✅ Generated {report.generated}, skipped {report.skipped}, failed {report.failed} "
+        f"({report.flashcards} flashcards)"
+    )
+    if report.failed:
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
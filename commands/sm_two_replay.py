@@ -0,0 +1,45 @@
+import asyncio
+import core.database as database
+from core.database import Database
+import typer
+
+from src.flashcard.application.services.sm_two.sm_two_replay import SmTwoParameters
+from src.flashcard.infrastructure.worker.sm_two_replayer import SmTwoReplayer
+from config import settings
+
+app = typer.Typer(help="SM-2 state replay CLI")
+
+database.db = Database(settings.database_url)
+
+DEFAULTS = SmTwoParameters()
+
+
+@app.command("replay")
+def replay(
+    apply: bool = typer.Option(False, help="Overwrite sm_two_flashcards, otherwise a dry run"),
+    initial_repetition_ratio: float = typer.Option(DEFAULTS.initial_repetition_ratio),
+    min_repetition_ratio: float = typer.Option(DEFAULTS.min_repetition_ratio),
+    first_interval_good: float = typer.Option(DEFAULTS.first_interval_good),
+    first_interval_very_good: float = typer.Option(DEFAULTS.first_interval_very_good),
+    second_interval: float = typer.Option(DEFAULTS.second_interval),
+    failed_interval: float = typer.Option(DEFAULTS.failed_interval),
+):
+    """Rebuild SM-2 state of all users from the rating event log"""
+
+    parameters = SmTwoParameters(
+        initial_repetition_ratio=initial_repetition_ratio,
+        min_repetition_ratio=min_repetition_ratio,
+        first_interval_good=first_interval_good,
+        first_interval_very_good=first_interval_very_good,
+        second_interval=second_interval,
+        failed_interval=failed_interval,
+    )
+    replayer = SmTwoReplayer(database.db.session_factory)
+    events, states = asyncio.run(replayer.replay(parameters, apply))
+
+    action = "Rebuilt" if apply else "Replayed (dry run)"
+    typer.echo(f"✅ {action} {states} flashcard states from {events} rating events")
+
+
+if __name__ == "__main__":
+    app()
@@ -16,6 +16,51 @@ class Settings(BaseSettings):
     apple_private_key: str
     apple_redirect_url: str
 
+    redis_url: str | None = None
+    cache_namespace: str = "voca"
+    cache_local_ttl: int = 5
+    cache_local_max_entries: int = 2048
+    admin_catalog_check_interval: int = 30
+
+    flashcard_generator: str = "gemini"
+    generation_workers: int = 2
+    # Seconds a generation job may wait for the model, by default longer than every
+    # retry of the Gemini client together
+    generation_job_timeout: int | None = None
+    generation_streaming: bool = False
+    generation_cache_pool_size: int = 3
+    generation_cache_ttl: int = 7 * 24 * 3600
+    # Weighted prompt template versions, e.g. "v1:90,v2:10"
+    flashcard_prompt_versions: str = "v1"
+    flashcard_prompt_dir: str | None = None
+    # What creating a near-duplicate of an owned flashcard does: reject, merge or allow
+    flashcard_near_duplicate_policy: str = "allow"
+    # Batches of at least this many rows are written with COPY instead of INSERT
+    bulk_copy_threshold: int = 500
+    # Responses of at least this many bytes are compressed, with brotli when accepted
+    response_compression_min_size: int = 1024
+    response_gzip_level: int = 6
+    response_brotli_quality: int = 4
+    # Outbox rows handed to deferred event listeners per batch, and the relay poll period
+    event_outbox_batch_size: int = 100
+    event_outbox_poll_interval: float = 5.0
+    # Seconds the relay waits after a commit to collect a larger batch
+    event_outbox_flush_delay: float = 2.0
+    # Save SM-2 and Leitner state behind the rating requests instead of in them
+    repetition_write_behind: bool = False
+    # Seconds a user's ratings wait to be saved together, unless the user has this many
+    # pending or the process this many in total
+    repetition_flush_delay: float = 2.0
+    repetition_max_pending: int = 20
+    repetition_max_buffered: int = 1000
+
+    gemini_model: str = "gemini-2.5-flash"
+    gemini_max_concurrency: int = 4
+    gemini_timeout: float = 60.0
+    gemini_max_retries: int = 2
+    gemini_breaker_threshold: int = 5
+    gemini_breaker_reset_timeout: float = 30.0
+
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
 
@@ -0,0 +1,34 @@
+from config import settings
+from src.flashcard.infrastructure.repository.admin_deck_catalog import AdminDeckCatalog
+from src.shared.util.cache import ICache, LocalCache, RedisCache, TwoTierCache
+
+
+def create_cache(redis_url: str | None, namespace: str) -> ICache:
+    local = LocalCache(namespace=namespace, max_entries=settings.cache_local_max_entries)
+    if not redis_url:
+        return local
+
+    import redis.asyncio as redis
+
+    remote = RedisCache(redis.from_url(redis_url), namespace=namespace)
+    return TwoTierCache(local, remote, local_ttl=settings.cache_local_ttl)
+
+
+cache: ICache | None = None
+
+
+def get_cache() -> ICache:
+    global cache
+    if cache is None:
+        cache = create_cache(settings.redis_url, settings.cache_namespace)
+    return cache
+
+
+admin_deck_catalog: AdminDeckCatalog | None = None
+
+
+def get_admin_deck_catalog() -> AdminDeckCatalog:
+    global admin_deck_catalog
+    if admin_deck_catalog is None:
+        admin_deck_catalog = AdminDeckCatalog(settings.admin_catalog_check_interval)
+    return admin_deck_catalog
@@ -2,6 +2,7 @@ from fastapi import Depends
 import punq
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.flashcard.application.command.import_deck import ImportDeckHandler
 from src.flashcard.application.command.merge_decks import MergeDecks
 from src.flashcard.application.facades.flashcard_facade import FlashcardFacade
 from src.flashcard.application.query.get_rating_stats import GetRatingStats
@@ -12,13 +13,17 @@ from src.flashcard.application.services.iflashcard_selector import IFlashcardSel
 from src.flashcard.application.services.irepetition_algorithm import IRepetitionAlgorithm
 from src.shared.flashcard.contracts import IFlashcardFacade
 from src.study.application.command.add_next_learning_step_handler import AddNextLearningStepHandler
+from src.study.application.command.advance_session import AdvanceSessionHandler
 from src.study.application.command.answer_exercise import AnswerExercise
 from src.study.application.command.create_session import CreateSessionHandler
-from src.study.application.command.rate_flashcard import RateFlashcard
 from src.study.application.repository.contracts import (
+    ILearningSessionPartitionRepository,
     ISessionRepository,
     IUnscrambleWordExerciseRepository,
 )
+from src.study.infrastructure.repository.learning_session_partition_repository import (
+    LearningSessionPartitionRepository,
+)
 from src.study.infrastructure.repository.learning_session_repository import (
     LearningSessionRepository,
 )
@@ -29,24 +34,32 @@ from src.flashcard.application.command.generate_flashcards import GenerateFlashc
 from src.flashcard.application.command.create_flashcard import CreateFlashcardHandler
 from src.flashcard.application.command.update_flashcard import UpdateFlashcardHandler
 from src.flashcard.application.command.bulk_delete_flashcards import BulkDeleteFlashcardsHandler
+from src.flashcard.application.query.export_deck import ExportDeck
 from src.flashcard.application.query.get_deck_details import GetDeckDetails
 from src.flashcard.application.query.get_decks_list import GetAdminDecks, GetUserDecks
 from src.flashcard.application.repository.contracts import (
+    IDeckArchiveRepository,
     IFlashcardDeckReadRepository,
     IFlashcardDeckRepository,
     IFlashcardDuplicateRepository,
     IFlashcardPollRepository,
+    IGenerationJobRepository,
     IFlashcardReadRepository,
     IFlashcardRepository,
+    IRatingEventRepository,
     ISmTwoFlashcardRepository,
     IStoryRepository,
 )
 from src.flashcard.application.services.deck_resolver import DeckResolver
 from src.flashcard.application.services.flashcard_duplicate_service import FlashcardDuplicateService
 from src.flashcard.application.services.flashcard_generator_service import FlashcardGeneratorService
-from src.flashcard.application.services.gemini_generator import GeminiGenerator
+from src.flashcard.application.services.gemini_generator import GeminiClient, GeminiGenerator
+from src.flashcard.application.services.fake_flashcard_generator import FakeFlashcardGenerator
 from src.flashcard.application.services.iflashcard_generator import IFlashcardGenerator
 from src.flashcard.application.services.story_duplicate_service import StoryDuplicateService
+from src.flashcard.infrastructure.repository.deck_archive_repository import (
+    DeckArchiveRepository,
+)
 from src.flashcard.infrastructure.repository.flashcard_deck_read_repository import (
     FlashcardDeckReadRepository,
 )
@@ -63,12 +76,33 @@ from src.flashcard.infrastructure.repository.flashcard_repository import Flashca
 from src.flashcard.infrastructure.repository.sm_two.criteria_factory import (
     FlashcardSortCriteriaFactory,
 )
+from src.flashcard.infrastructure.repository.rating_event_repository import (
+    RatingEventRepository,
+)
 from src.flashcard.infrastructure.repository.sm_two_flashcard_repository import (
     SmTwoFlashcardRepository,
 )
 from src.flashcard.infrastructure.repository.story_repository import StoryRepository
+from src.flashcard.infrastructure.repository.generation_job_repository import (
+    GenerationJobRepository,
+)
+from src.flashcard.application.command.enqueue_flashcards_generation import (
+    EnqueueFlashcardsGenerationHandler,
+)
+from src.flashcard.application.query.get_generation_job import GetGenerationJob
 from src.shared.user.iuser_facade import IUserFacade
+from src.shared.util.cache import ICache
+from src.shared.util.event_dispatcher import EventDispatcher, IEventDispatcher, IEventOutbox
+from src.shared.util.event_outbox import EventOutbox
+from core.events import get_outbox_relay
+from src.flashcard.application.services.deck_details_cache import DeckDetailsCacheInvalidator
+from src.flashcard.application.services.generation_cache import (
+    GenerationCachePolicy,
+    GenerationResultCache,
+)
+from src.flashcard.domain.events import DeckContentChanged, FlashcardRated
 from src.shared.util.hash import ArgonHash, IHash
+from src.shared.util.unit_of_work import IUnitOfWork, UnitOfWork
 from src.user.application.command.create_external_user import CreateExternalUserHandler
 from src.user.application.command.create_token import CreateTokenHandler
 from src.user.application.command.create_user import CreateUserHandler
@@ -96,6 +130,11 @@ from src.flashcard.infrastructure.repository.flashcard_poll_repository import (
 from src.flashcard.application.services.sm_two.sm_two_repetition_algorithm import (
     SmTwoRepetitionAlgorithm,
 )
+from src.flashcard.application.services.sm_two.sm_two_write_behind import (
+    ISmTwoWriteBuffer,
+    SmTwoWriteBehind,
+)
+from core.write_behind import get_sm_two_write_buffer
 from src.study.application.services.exercise_factory import ExerciseFactory
 from src.study.infrastructure.repository.word_match_exercise_repository import (
     WordMatchExerciseRepository,
@@ -103,21 +142,44 @@ from src.study.infrastructure.repository.word_match_exercise_repository import (
 from src.study.application.repository.contracts import IWordMatchExerciseRepository
 from src.study.application.command.skip_exercise import SkipExercise
 from core.database import get_session
+from core.cache import get_admin_deck_catalog, get_cache
+from core.gemini import get_gemini_client
+from src.flashcard.infrastructure.repository.admin_deck_catalog import AdminDeckCatalog
 
 
-def create_container(session: AsyncSession):
+def create_container(
+    session: AsyncSession,
+    cache: ICache | None = None,
+    admin_deck_catalog: AdminDeckCatalog | None = None,
+    gemini_client: GeminiClient | None = None,
+):
     container = punq.Container()
     container.register(AsyncSession, instance=session)
+    container.register(IUnitOfWork, instance=UnitOfWork(session))
+    container.register(ICache, instance=cache or get_cache())
+    container.register(AdminDeckCatalog, instance=admin_deck_catalog or get_admin_deck_catalog())
+    container.register(GeminiClient, instance=gemini_client or get_gemini_client())
 
     container.register(FlashcardSortCriteriaFactory)
     container.register(SmTwoFlashcardRepository)
     container.register(ISmTwoFlashcardRepository, SmTwoFlashcardRepository)
+    container.register(IRatingEventRepository, RatingEventRepository)
     container.register(GetUserDecks)
     container.register(GetAdminDecks)
     container.register(GetDeckDetails)
     container.register(IFlashcardDeckReadRepository, FlashcardDeckReadRepository)
     container.register(FlashcardGeneratorService)
-    container.register(IFlashcardGenerator, GeminiGenerator)
+    container.register(GenerationResultCache)
+    container.register(
+        GenerationCachePolicy,
+        instance=GenerationCachePolicy(
+            pool_size=settings.generation_cache_pool_size, ttl=settings.generation_cache_ttl
+        ),
+    )
+    container.register(
+        IFlashcardGenerator,
+        FakeFlashcardGenerator if settings.flashcard_generator == "fake" else GeminiGenerator,
+    )
     container.register(DeckResolver)
     container.register(GenerateFlashcardsHandler)
     container.register(CreateFlashcardHandler)
@@ -157,20 +219,23 @@ def create_container(session: AsyncSession):
     container.register(UnscrambleWordExerciseRepository)
     container.register(LearningSessionRepository)
     container.register(ISessionRepository, LearningSessionRepository)
+    container.register(ILearningSessionPartitionRepository, LearningSessionPartitionRepository)
 
     container.register(IFlashcardFacade, FlashcardFacade)
     container.register(IFlashcardSelector, SmTwoFlashcardSelector)
     container.register(IFlashcardPollRepository, FlashcardPollRepository)
     container.register(IRepetitionAlgorithm, SmTwoRepetitionAlgorithm)
+    container.register(ISmTwoWriteBuffer, instance=get_sm_two_write_buffer())
+    container.register(SmTwoWriteBehind)
     container.register(FlashcardPollUpdater)
     container.register(FlashcardPollManager)
     container.register(FlashcardPollResolver)
     container.register(CreateSessionHandler)
     container.register(FlashcardFacade)
+    container.register(AdvanceSessionHandler)
     container.register(AddNextLearningStepHandler)
     container.register(ExerciseFactory)
     container.register(IUnscrambleWordExerciseRepository, UnscrambleWordExerciseRepository)
-    container.register(RateFlashcard)
     container.register(WordMatchExerciseRepository)
     container.register(IWordMatchExerciseRepository, WordMatchExerciseRepository)
     container.register(AnswerExercise)
@@ -180,9 +245,33 @@ def create_container(session: AsyncSession):
     container.register(MergeDecks)
     container.register(IFlashcardReadRepository, FlashcardReadRepository)
     container.register(GetRatingStats)
+    container.register(DeckDetailsCacheInvalidator)
+    container.register(IGenerationJobRepository, GenerationJobRepository)
+    container.register(EnqueueFlashcardsGenerationHandler)
+    container.register(GetGenerationJob)
+    container.register(IDeckArchiveRepository, DeckArchiveRepository)
+    container.register(ExportDeck)
+    container.register(ImportDeckHandler)
+
+    container.register(IEventOutbox, EventOutbox)
+
+    # listen() runs in the command's transaction, listen_deferred() after it commits
+    events = EventDispatcher(
+        outbox=container.resolve(IEventOutbox),
+        uow=container.resolve(IUnitOfWork),
+        relay=get_outbox_relay(),
+    )
+    events.listen(DeckContentChanged, lambda: container.resolve(DeckDetailsCacheInvalidator))
+    events.listen(FlashcardRated, lambda: container.resolve(DeckDetailsCacheInvalidator))
+    container.register(IEventDispatcher, instance=events)
 
     return container
 
 
-def get_container(session: AsyncSession = Depends(get_session)) -> punq.Container:
-    return create_container(session)
+def get_container(
+    session: AsyncSession = Depends(get_session),
+    cache: ICache = Depends(get_cache),
+    admin_deck_catalog: AdminDeckCatalog = Depends(get_admin_deck_catalog),
+    gemini_client: GeminiClient = Depends(get_gemini_client),
+) -> punq.Container:
+    return create_container(session, cache, admin_deck_catalog, gemini_client)
@@ -3,10 +3,21 @@ from typing import AsyncGenerator
 from core.models import Base
 
 
+# Learning sessions and their steps are partitioned alike, so their joins and
+# aggregates can run partition by partition
+SERVER_SETTINGS = {"enable_partitionwise_join": "on", "enable_partitionwise_aggregate": "on"}
+
+
 class Database:
     def __init__(self, url: str):
         self.engine = create_async_engine(
-            url, echo=False, pool_size=10, max_overflow=20, pool_timeout=30, pool_recycle=1800
+            url,
+            echo=False,
+            pool_size=10,
+            max_overflow=20,
+            pool_timeout=30,
+            pool_recycle=1800,
+            connect_args={"server_settings": SERVER_SETTINGS},
         )
         self.session_factory = async_sessionmaker(
             self.engine, class_=AsyncSession, expire_on_commit=False
@@ -32,8 +43,8 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     global db
     async for session in db.get_session():
         try:
+            # Writes commit through the unit of work, anything left open is rolled back
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -2,36 +2,21 @@ from core.db import set_db_session_context
 from fastapi import Response
 from starlette.requests import Request
 from core.db import get_session
-import asyncio
-from sqlalchemy.exc import OperationalError
 
 from core.logging import logger
-
-
-async def _commit_with_retry(session, retries=3, delay=0.1):
-    for attempt in range(retries):
-        try:
-            await session.commit()
-            return
-        except OperationalError as e:
-            if "deadlock" in str(e).lower() and attempt < retries - 1:
-                await asyncio.sleep(delay)
-                continue
-            raise
+from src.shared.util.unit_of_work import UnitOfWork
 
 
 async def db_session(request: Request, call_next):
     response = Response("Internal server error", status_code=500)
+    set_db_session_context(session_id=hash(request))
+    session = get_session()
 
     try:
-        set_db_session_context(session_id=hash(request))
-        response = await call_next(request)
-        await _commit_with_retry(get_session())
-
-    except Exception:
-        await get_session().rollback()
-        raise
+        # Commits when the request succeeds, rolls back on error
+        async with UnitOfWork(session).transaction():
+            response = await call_next(request)
     finally:
-        await get_session().close()
+        await session.close()
         set_db_session_context(session_id=None)
     return response
@@ -0,0 +1,15 @@
+from config import settings
+from src.shared.util.event_outbox import OutboxRelay
+
+outbox_relay: OutboxRelay | None = None
+
+
+def get_outbox_relay() -> OutboxRelay:
+    global outbox_relay
+    if outbox_relay is None:
+        outbox_relay = OutboxRelay(
+            batch_size=settings.event_outbox_batch_size,
+            poll_interval=settings.event_outbox_poll_interval,
+            flush_delay=settings.event_outbox_flush_delay,
+        )
+    return outbox_relay
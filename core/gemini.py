@@ -0,0 +1,36 @@
+from config import settings
+from src.flashcard.application.services.gemini_generator import GeminiClient
+from src.shared.util.circuit_breaker import CircuitBreaker
+
+
+def create_gemini_client() -> GeminiClient:
+    return GeminiClient(
+        api_key=settings.gemini_api_key,
+        model=settings.gemini_model,
+        max_concurrency=settings.gemini_max_concurrency,
+        timeout=settings.gemini_timeout,
+        max_retries=settings.gemini_max_retries,
+        breaker=CircuitBreaker(
+            failure_threshold=settings.gemini_breaker_threshold,
+            reset_timeout=settings.gemini_breaker_reset_timeout,
+        ),
+    )
+
+
+gemini_client: GeminiClient | None = None
+
+
+def get_gemini_client() -> GeminiClient:
+    global gemini_client
+    if gemini_client is None:
+        gemini_client = create_gemini_client()
+    return gemini_client
+
+
+def generation_job_timeout() -> float:
+    """The configured job timeout, or one that does not cut off the client's retries."""
+    if settings.generation_job_timeout is not None:
+        return settings.generation_job_timeout
+    client = get_gemini_client()
+    # One more attempt's worth for waiting on a free connection slot
+    return client.max_duration() + client.timeout
@@ -1,9 +1,8 @@
-from typing import Generic, TypeVar, List
+from typing import Generic, TypeVar
 from pydantic import BaseModel
-from pydantic.generics import GenericModel
 
 T = TypeVar("T", bound=BaseModel)  # T must be a Pydantic model
 
 
-class ResponseWrapper(GenericModel, Generic[T]):
+class ResponseWrapper(BaseModel, Generic[T]):
     data: T
@@ -8,6 +8,7 @@ from sqlalchemy import (
     Boolean,
     CheckConstraint,
     Computed,
+    DDL,
     Double,
     ForeignKeyConstraint,
     Index,
@@ -21,6 +22,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     Uuid,
+    event,
     text,
 )
 from sqlalchemy.dialects.postgresql import TIMESTAMP
@@ -87,6 +89,56 @@ class FailedJobs(Base):
     )
 
 
+class GenerationJobs(Base):
+    __tablename__ = "generation_jobs"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["user_id"], ["users.id"], ondelete="CASCADE", name="generation_jobs_user_id_foreign"
+        ),
+        PrimaryKeyConstraint("id", name="generation_jobs_pkey"),
+        Index("generation_jobs_status_available_at_index", "status", "available_at"),
+        Index("generation_jobs_user_id_index", "user_id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    result: Mapped[Optional[dict]] = mapped_column(JSON)
+    error: Mapped[Optional[str]] = mapped_column(Text)
+    attempts: Mapped[int] = mapped_column(SmallInteger, nullable=False, server_default=text("0"))
+    max_attempts: Mapped[int] = mapped_column(
+        SmallInteger, nullable=False, server_default=text("3")
+    )
+    available_at: Mapped[datetime.datetime] = mapped_column(
+        TIMESTAMP(precision=0), nullable=False, server_default=text("CURRENT_TIMESTAMP")
+    )
+    locked_at: Mapped[Optional[datetime.datetime]] = mapped_column(TIMESTAMP(precision=0))
+    created_at: Mapped[Optional[datetime.datetime]] = mapped_column(TIMESTAMP(precision=0))
+    updated_at: Mapped[Optional[datetime.datetime]] = mapped_column(TIMESTAMP(precision=0))
+
+
+class OutboxEvents(Base):
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        PrimaryKeyConstraint("id", name="outbox_events_pkey"),
+        Index("outbox_events_available_at_id_index", "available_at", "id"),
+        Index("outbox_events_stream_id_index", "stream", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    stream: Mapped[Optional[str]] = mapped_column(String(100))
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    attempts: Mapped[int] = mapped_column(SmallInteger, nullable=False, server_default=text("0"))
+    error: Mapped[Optional[str]] = mapped_column(Text)
+    available_at: Mapped[datetime.datetime] = mapped_column(
+        TIMESTAMP(precision=0), nullable=False, server_default=text("CURRENT_TIMESTAMP")
+    )
+    failed_at: Mapped[Optional[datetime.datetime]] = mapped_column(TIMESTAMP(precision=0))
+    created_at: Mapped[Optional[datetime.datetime]] = mapped_column(TIMESTAMP(precision=0))
+
+
 class Migrations(Base):
     __tablename__ = "migrations"
     __table_args__ = (PrimaryKeyConstraint("id", name="migrations_pkey"),)
@@ -427,6 +479,38 @@ class Flashcards(Base):
         PrimaryKeyConstraint("id", name="flashcards_pkey"),
         Index("flashcards_flashcard_category_id_index", "flashcard_deck_id"),
         Index("flashcards_user_id_index", "user_id"),
+        Index(
+            "flashcards_flashcard_deck_id_lower_front_word_index",
+            "flashcard_deck_id",
+            text("lower((front_word)::text)"),
+        ),
+        Index(
+            "flashcards_user_id_normalized_front_langs_index",
+            "user_id",
+            "normalized_front",
+            "front_lang",
+            "back_lang",
+        ),
+        Index(
+            "flashcards_flashcard_deck_id_hashed_id_index",
+            "flashcard_deck_id",
+            text("hashint8(id)"),
+        ),
+        Index("flashcards_user_id_hashed_id_index", "user_id", text("hashint8(id)")),
+        Index(
+            "flashcards_admin_id_hashed_id_index",
+            "admin_id",
+            text("hashint8(id)"),
+            postgresql_where=text("admin_id IS NOT NULL"),
+        ),
+        Index(
+            "flashcards_admin_id_normalized_front_langs_index",
+            "admin_id",
+            "normalized_front",
+            "front_lang",
+            "back_lang",
+            postgresql_where=text("admin_id IS NOT NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
@@ -436,6 +520,7 @@ class Flashcards(Base):
     back_lang: Mapped[str] = mapped_column(String(255), nullable=False)
     front_context: Mapped[str] = mapped_column(String(255), nullable=False)
     back_context: Mapped[str] = mapped_column(String(255), nullable=False)
+    normalized_front: Mapped[Optional[str]] = mapped_column(String(255))
     language_level: Mapped[str] = mapped_column(
         String(255), nullable=False, server_default=text("'B2'::character varying")
     )
@@ -465,6 +550,67 @@ class Flashcards(Base):
     )
 
 
+class CatalogVersions(Base):
+    """
+    Change counters of catalogs cached in process. A counter is bumped by triggers in
+    the transaction of the change, so it moves exactly when the data it covers does.
+    """
+
+    __tablename__ = "catalog_versions"
+    __table_args__ = (PrimaryKeyConstraint("name", name="catalog_versions_pkey"),)
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+
+
+ADMIN_DECK_CATALOG = "admin_deck_catalog"
+
+# Statement level, so a bulk write bumps the counter once, and only when one of the
+# written rows belongs to an admin. Branches read just the transition tables of their
+# operation, PL/pgSQL plans a query on its first run only.
+_ADMIN_DECK_CATALOG_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION bump_admin_deck_catalog_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    changed boolean := false;
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        changed := EXISTS (SELECT 1 FROM new_rows WHERE admin_id IS NOT NULL);
+    END IF;
+    IF NOT changed AND TG_OP IN ('UPDATE', 'DELETE') THEN
+        changed := EXISTS (SELECT 1 FROM old_rows WHERE admin_id IS NOT NULL);
+    END IF;
+    IF changed THEN
+        INSERT INTO catalog_versions (name, version) VALUES ('{ADMIN_DECK_CATALOG}', 1)
+        ON CONFLICT (name) DO UPDATE SET version = catalog_versions.version + 1;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+_TRANSITION_TABLES = {
+    "insert": "NEW TABLE AS new_rows",
+    "update": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "delete": "OLD TABLE AS old_rows",
+}
+
+# On the metadata, so both tables exist, and idempotent like create_all itself
+event.listen(Base.metadata, "after_create", DDL(_ADMIN_DECK_CATALOG_FUNCTION))
+for _table in (FlashcardDecks.__table__, Flashcards.__table__):
+    for _operation, _transition_tables in _TRANSITION_TABLES.items():
+        event.listen(
+            Base.metadata,
+            "after_create",
+            DDL(
+                f"CREATE OR REPLACE TRIGGER {_table.name}_admin_deck_catalog_{_operation} "
+                f"AFTER {_operation.upper()} ON {_table.name} "
+                f"REFERENCING {_transition_tables} FOR EACH STATEMENT "
+                "EXECUTE FUNCTION bump_admin_deck_catalog_version()"
+            ),
+        )
+
+
 class LearningSessions(Base):
     __tablename__ = "learning_sessions"
     __table_args__ = (
@@ -477,6 +623,8 @@ class LearningSessions(Base):
         ForeignKeyConstraint(["user_id"], ["users.id"], name="learning_sessions_user_id_foreign"),
         PrimaryKeyConstraint("id", name="learning_sessions_pkey"),
         Index("learning_sessions_flashcard_category_id_index", "flashcard_deck_id"),
+        Index("learning_sessions_user_id_id_index", "user_id", "id"),
+        {"postgresql_partition_by": "RANGE (id)"},
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
@@ -554,14 +702,15 @@ class LearningSessionFlashcards(Base):
             ondelete="CASCADE",
             name="learning_session_flashcards_learning_session_id_foreign",
         ),
-        PrimaryKeyConstraint("id", name="learning_session_flashcards_pkey"),
+        PrimaryKeyConstraint("id", "learning_session_id", name="learning_session_flashcards_pkey"),
         Index("learning_session_flashcards_exercise_entry_id_index", "exercise_entry_id"),
         Index("learning_session_flashcards_flashcard_id_index", "flashcard_id"),
         Index("learning_session_flashcards_learning_session_id_index", "learning_session_id"),
+        {"postgresql_partition_by": "RANGE (learning_session_id)"},
     )
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
-    learning_session_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    learning_session_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     flashcard_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     is_additional: Mapped[bool] = mapped_column(
         Boolean, nullable=False, server_default=text("false")
@@ -580,6 +729,160 @@ class LearningSessionFlashcards(Base):
     )
 
 
+# Sessions and their steps are range partitioned by session id with the same bounds,
+# so a session and its steps share a partition index. A partition holds this many
+# session ids; the default partition takes ids no range partition covers yet.
+LEARNING_SESSION_PARTITION_SIZE = 1_000_000
+
+
+def learning_session_partition(table: str, index: int) -> str:
+    return f"{table}_p{index}"
+
+
+for _table in (LearningSessions.__table__, LearningSessionFlashcards.__table__):
+    event.listen(
+        _table,
+        "after_create",
+        DDL(f"CREATE TABLE {_table.name}_default PARTITION OF {_table.name} DEFAULT"),
+    )
+
+
+RATING_EVENTS_PARTITIONS = 8
+
+
+class RatingEvents(Base):
+    """
+    Append-only log of every rating. Hash partitioned by user, so all events of a
+    user are in one partition and a replay can work through the log one partition
+    at a time.
+    """
+
+    __tablename__ = "rating_events"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["flashcard_id"],
+            ["flashcards.id"],
+            ondelete="CASCADE",
+            name="rating_events_flashcard_id_foreign",
+        ),
+        ForeignKeyConstraint(
+            ["user_id"], ["users.id"], ondelete="CASCADE", name="rating_events_user_id_foreign"
+        ),
+        PrimaryKeyConstraint("user_id", "id", name="rating_events_pkey"),
+        {"postgresql_partition_by": "HASH (user_id)"},
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
+    flashcard_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    rating: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        TIMESTAMP(precision=0), nullable=False, server_default=text("CURRENT_TIMESTAMP")
+    )
+
+
+def rating_events_partition(remainder: int) -> str:
+    return f"rating_events_p{remainder}"
+
+
+for _remainder in range(RATING_EVENTS_PARTITIONS):
+    event.listen(
+        RatingEvents.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE {rating_events_partition(_remainder)} PARTITION OF rating_events "
+            f"FOR VALUES WITH (MODULUS {RATING_EVENTS_PARTITIONS}, REMAINDER {_remainder})"
+        ),
+    )
+
+
+class StudyVersions(Base):
+    """
+    Per-user change counter of the ratings and session steps, the cheap version of
+    the statistics and deck views derived from them. Bumped by triggers: rating
+    events cover every rating and, through the cascade, removed flashcards. Inserted
+    steps cover new activities.
+    """
+
+    __tablename__ = "study_versions"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["user_id"], ["users.id"], ondelete="CASCADE", name="study_versions_user_id_foreign"
+        ),
+        PrimaryKeyConstraint("user_id", name="study_versions_pkey"),
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+
+
+# Statement level, so a write bumps every affected user once. Deletes only bump existing
+# counters, a user deleted in the same statement has no row left to reference.
+_STUDY_VERSIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_study_versions() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'learning_session_flashcards' THEN
+        INSERT INTO study_versions (user_id, version)
+        SELECT DISTINCT sessions.user_id, 1
+        FROM new_rows JOIN learning_sessions AS sessions
+            ON sessions.id = new_rows.learning_session_id
+        ORDER BY 1
+        ON CONFLICT (user_id) DO UPDATE SET version = study_versions.version + 1;
+    ELSIF TG_OP = 'INSERT' THEN
+        INSERT INTO study_versions (user_id, version)
+        SELECT DISTINCT user_id, 1 FROM new_rows ORDER BY 1
+        ON CONFLICT (user_id) DO UPDATE SET version = study_versions.version + 1;
+    ELSE
+        UPDATE study_versions SET version = version + 1
+        WHERE user_id IN (SELECT user_id FROM old_rows);
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+_STUDY_VERSION_TRIGGERS = (
+    ("rating_events", "insert", "NEW TABLE AS new_rows"),
+    ("rating_events", "delete", "OLD TABLE AS old_rows"),
+    ("learning_session_flashcards", "insert", "NEW TABLE AS new_rows"),
+)
+
+event.listen(Base.metadata, "after_create", DDL(_STUDY_VERSIONS_FUNCTION))
+for _table_name, _operation, _transition_table in _STUDY_VERSION_TRIGGERS:
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(
+            f"CREATE OR REPLACE TRIGGER {_table_name}_study_version_{_operation} "
+            f"AFTER {_operation.upper()} ON {_table_name} "
+            f"REFERENCING {_transition_table} FOR EACH STATEMENT "
+            "EXECUTE FUNCTION bump_study_versions()"
+        ),
+    )
+
+
+class RatingEventCursors(Base):
+    """
+    Last rating event whose SM-2 and Leitner updates are saved, for users whose
+    ratings are written behind. Later events of the user are pending.
+    """
+
+    __tablename__ = "rating_event_cursors"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            ondelete="CASCADE",
+            name="rating_event_cursors_user_id_foreign",
+        ),
+        PrimaryKeyConstraint("user_id", name="rating_event_cursors_pkey"),
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
+    rating_event_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
 class SmTwoFlashcards(Base):
     __tablename__ = "sm_two_flashcards"
     __table_args__ = (
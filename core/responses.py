@@ -0,0 +1,52 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+# Responses are per user; clients and proxies keep them but revalidate every time
+CACHE_CONTROL = "private, no-cache"
+
+
+class ModelResponse(JSONResponse):
+    """
+    Opt-in fast path for responses built by our own mappers from trusted DTOs.
+
+    FastAPI returns a Response untouched, so the model is not validated again
+    against response_model nor walked by jsonable_encoder; it is serialized once
+    by its prebuilt pydantic-core serializer. Keep response_model on the route
+    for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, by_alias=True)
+
+
+def weak_etag(*parts: Any) -> str:
+    """
+    Weak ETag from everything the representation depends on: the request
+    parameters and a cheap version stamp of the data, never the rendered body.
+    Weak, because the identity, gzip and br bodies of a response share it.
+    """
+    digest = hashlib.blake2b(to_json(parts, fallback=str), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match uses the weak comparison, with or without the W/ prefix."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in header.split(","))
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers=etag_headers(etag))
@@ -0,0 +1,15 @@
+from config import settings
+from src.flashcard.infrastructure.worker.sm_two_write_buffer import SmTwoWriteBuffer
+
+sm_two_write_buffer: SmTwoWriteBuffer | None = None
+
+
+def get_sm_two_write_buffer() -> SmTwoWriteBuffer:
+    global sm_two_write_buffer
+    if sm_two_write_buffer is None:
+        sm_two_write_buffer = SmTwoWriteBuffer(
+            flush_delay=settings.repetition_flush_delay,
+            max_pending=settings.repetition_max_pending,
+            max_buffered=settings.repetition_max_buffered,
+        )
+    return sm_two_write_buffer